@@ -54,17 +54,35 @@ _DAYS_IN_MONTHS_LEAP = [
     31,  # December.
 ]
 
-# Combined list of days per month. A sentinel value of 0 is added to the top of
-# the array so indexing is easier.
-_DAYS_IN_MONTHS_COMBINED = [0] + _DAYS_IN_MONTHS_NON_LEAP + _DAYS_IN_MONTHS_LEAP
+# Lookup tables derived from the lists above. They are kept as numpy arrays so
+# that they are converted to tensors without going through a Python list each
+# time. (A module-level tf.constant would be an eager tensor, which TF1-style
+# graphs can't capture.)
+
+# Days per month. A sentinel value of 0 is added to the top of the arrays so
+# that they can be indexed by one-based months.
+_DAYS_IN_MONTHS_NON_LEAP_TABLE = np.array(
+    [0] + _DAYS_IN_MONTHS_NON_LEAP, dtype=np.int32)
+_DAYS_IN_MONTHS_LEAP_TABLE = np.array(
+    [0] + _DAYS_IN_MONTHS_LEAP, dtype=np.int32)
+
+# Days in the year before the first day of each month. Indexed by zero-based
+# months.
+_DAYS_BEFORE_MONTHS_NON_LEAP_TABLE = np.cumsum(
+    [0] + _DAYS_IN_MONTHS_NON_LEAP[:-1], dtype=np.int32)
+_DAYS_BEFORE_MONTHS_LEAP_TABLE = np.cumsum(
+    [0] + _DAYS_IN_MONTHS_LEAP[:-1], dtype=np.int32)
 
 _ORDINAL_OF_1_1_1970 = 719163
 
+# Cache of functions used by `convert_to_date_tensor`, keyed by input type.
+_CONVERTERS_BY_TYPE = {}
+
 
 class DateTensor(tensor_wrapper.TensorWrapper):
   """Represents a tensor of dates."""
 
-  def __init__(self, ordinals, years, months, days):
+  def __init__(self, ordinals, years=None, months=None, days=None):
     """Initializer.
 
     This initializer is primarily for internal use. More convenient construction
@@ -74,9 +92,14 @@ class DateTensor(tensor_wrapper.TensorWrapper):
       ordinals: Tensor of type int32. Each value is number of days since
         1 Jan 0001. 1 Jan 0001 has `ordinal=1`. `years`, `months` and `days`
         must represent the same dates as `ordinals`.
-      years: Tensor of type int32, of same shape as `ordinals`.
-      months: Tensor of type int32, of same shape as `ordinals`
+      years: Tensor of type int32, of same shape as `ordinals`. Either all or
+        none of `years`, `months` and `days` should be supplied. If none are,
+        they are computed from `ordinals` when first needed.
+        Default value: None.
+      months: Tensor of type int32, of same shape as `ordinals`.
+        Default value: None.
       days: Tensor of type int32, of same shape as `ordinals`.
+        Default value: None.
     """
     # The internal representation of a DateTensor is all four int32 Tensors
     # (ordinals, years, months, days). Why do we need such redundancy?
@@ -99,14 +122,51 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     #
     # A similar argument shows why (y, m, d) is not an optimal representation
     # either - for e.g. adding days instead of months.
-
-    self._ordinals = tf.convert_to_tensor(
-        ordinals, dtype=tf.int32, name="dt_ordinals")
-    self._years = tf.convert_to_tensor(years, dtype=tf.int32, name="dt_years")
-    self._months = tf.convert_to_tensor(
-        months, dtype=tf.int32, name="dt_months")
-    self._days = tf.convert_to_tensor(days, dtype=tf.int32, name="dt_days")
+    #
+    # When a DateTensor is created from ordinals only, o -> y, m, d is deferred
+    # until years, months or days are actually needed. Many computations
+    # (comparisons, days_until, adding days) never need them.
+    #
+    # Why not store months and days (or even years) in narrower integer types?
+    # year(), month() and day() return int32 tensors, and all the date
+    # arithmetic here and in the callers is int32. Narrow storage would mean a
+    # cast (i.e. a new int32 tensor) on every access, which costs more memory
+    # traffic than it saves. Besides, TF doesn't provide kernels for many
+    # int8/int16 ops (e.g. floordiv, floormod) on all devices.
+    #
+    # For the same reason years, months and days are not packed into a single
+    # int32 tensor (e.g. as year << 16 | month << 8 | day): TF ops consume
+    # whole tensors, so every use of a component would first unpack it with
+    # shifts and masks into a new tensor.
+
+    self._ordinals = _to_int32_tensor(ordinals, name="dt_ordinals")
+    supplied = [x is not None for x in (years, months, days)]
+    if any(supplied) and not all(supplied):
+      raise ValueError("Either all or none of years, months and days should be "
+                       "supplied.")
+    if years is None:
+      self._years, self._months, self._days = None, None, None  # Lazy.
+    else:
+      self._years = _to_int32_tensor(years, name="dt_years")
+      self._months = _to_int32_tensor(months, name="dt_months")
+      self._days = _to_int32_tensor(days, name="dt_days")
     self._day_of_year = None  # Computed lazily.
+    self._day_of_week = None  # Computed lazily.
+
+  def _year_month_day(self):
+    """Returns years, months and days, computing them from ordinals if needed.
+
+    The computed tensors are cached only if they belong to the same graph (or
+    eager context) as the ordinals. Otherwise, e.g. when a DateTensor created
+    eagerly is used inside a `tf.function`, caching them would leak graph
+    tensors out of the function.
+    """
+    if self._years is not None:
+      return self._years, self._months, self._days
+    years_months_days = date_utils.ordinal_to_year_month_day(self._ordinals)
+    if _in_current_context(self._ordinals):
+      self._years, self._months, self._days = years_months_days
+    return years_months_days
 
   def day(self):
     """Returns an int32 tensor of days since the beginning the month.
@@ -120,7 +180,8 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dates.day()  # [25, 2]
     ```
     """
-    return self._days
+    _, _, days = self._year_month_day()
+    return days
 
   def day_of_week(self):
     """Returns an int32 tensor of weekdays.
@@ -134,9 +195,14 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dates.days_of_week()  # [5, 1]
     ```
     """
+    if self._day_of_week is not None:
+      return self._day_of_week
     # 1 Jan 0001 was Monday according to the proleptic Gregorian calendar.
     # So, 1 Jan 0001 has ordinal 1, and the weekday is 0.
-    return (self._ordinals - 1) % 7
+    day_of_week = (self._ordinals - 1) % 7
+    if _in_current_context(self._ordinals):  # See _year_month_day.
+      self._day_of_week = day_of_week
+    return day_of_week
 
   def month(self):
     """Returns an int32 tensor of months.
@@ -147,7 +213,8 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dates.month()  # [1, 3]
     ```
     """
-    return self._months
+    _, months, _ = self._year_month_day()
+    return months
 
   def year(self):
     """Returns an int32 tensor of years.
@@ -158,7 +225,8 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dates.year()  # [2019, 2020]
     ```
     """
-    return self._years
+    years, _, _ = self._year_month_day()
+    return years
 
   def ordinal(self):
     """Returns an int32 tensor of ordinals.
@@ -186,20 +254,20 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dt.day_of_year()  # [25, 62]
     ```
     """
-    if self._day_of_year is None:
-      cumul_days_in_month_nonleap = tf.math.cumsum(
-          _DAYS_IN_MONTHS_NON_LEAP, exclusive=True)
-      cumul_days_in_month_leap = tf.math.cumsum(
-          _DAYS_IN_MONTHS_LEAP, exclusive=True)
-      days_before_month_non_leap = tf.gather(cumul_days_in_month_nonleap,
-                                             self.month() - 1)
-      days_before_month_leap = tf.gather(cumul_days_in_month_leap,
-                                         self.month() - 1)
-      days_before_month = tf.where(date_utils.is_leap_year(self.year()),
-                                   days_before_month_leap,
-                                   days_before_month_non_leap)
-      self._day_of_year = days_before_month + self.day()
-    return self._day_of_year
+    if self._day_of_year is not None:
+      return self._day_of_year
+    years, months, days = self._year_month_day()
+    days_before_month_non_leap = tf.gather(
+        _DAYS_BEFORE_MONTHS_NON_LEAP_TABLE, months - 1)
+    days_before_month_leap = tf.gather(_DAYS_BEFORE_MONTHS_LEAP_TABLE,
+                                       months - 1)
+    days_before_month = tf.where(date_utils.is_leap_year(years),
+                                 days_before_month_leap,
+                                 days_before_month_non_leap)
+    day_of_year = days_before_month + days
+    if _in_current_context(self._ordinals):  # See _year_month_day.
+      self._day_of_year = day_of_year
+    return day_of_year
 
   def days_until(self, target_date_tensor):
     """Returns an int32 tensor with numbers of days until the target dates.
@@ -236,7 +304,7 @@ class DateTensor(tensor_wrapper.TensorWrapper):
     dates.period_length_in_days(periods)  # [29, 61]
     ```
     """
-    return (self + period_tensor).ordinal() - self._ordinals
+    return self._add_period_ordinal_only(period_tensor) - self._ordinals
 
   @property
   def shape(self):
@@ -280,25 +348,49 @@ class DateTensor(tensor_wrapper.TensorWrapper):
       return self + periods.PeriodTensor(period_tensor.quantity() * 7,
                                          constants.PeriodType.DAY)
 
-    def adjust_day(year, month, day):
-      is_leap = date_utils.is_leap_year(year)
-      days_in_months = tf.constant(_DAYS_IN_MONTHS_COMBINED, tf.int32)
-      max_days = tf.gather(days_in_months,
-                           month + 12 * tf.dtypes.cast(is_leap, np.int32))
-      return tf.math.minimum(day, max_days)
+    if period_type == constants.PeriodType.MONTH:
+      y, m, d, o = _add_months(*self._year_month_day(),
+                               period_tensor.quantity())
+      return DateTensor(o, y, m, d)
+
+    if period_type == constants.PeriodType.YEAR:
+      y, m, d = self._year_month_day()
+      y, d, o = _add_years(y, m, d, period_tensor.quantity())
+      # Only materialize broadcast months if the shape has changed.
+      if not (m.shape.is_fully_defined() and m.shape == y.shape):
+        m = tf.broadcast_to(m, tf.shape(y))
+      return DateTensor(o, y, m, d)
+
+    raise ValueError("Unrecognized period type: {}".format(period_type))
+
+  def _add_period_ordinal_only(self, period_tensor):
+    """Returns the ordinals of `self + period_tensor`.
+
+    Unlike `__add__`, doesn't create a new DateTensor from the results.
+
+    Args:
+      period_tensor: a PeriodTensor object broadcastable to the shape of
+        "self".
+
+    Returns:
+      An int32 tensor of ordinals.
+    """
+    period_type = period_tensor.period_type()
+
+    if period_type == constants.PeriodType.DAY:
+      return self._ordinals + period_tensor.quantity()
+
+    if period_type == constants.PeriodType.WEEK:
+      return self._ordinals + period_tensor.quantity() * 7
 
     if period_type == constants.PeriodType.MONTH:
-      m = self._months - 1 + period_tensor.quantity()
-      y = self._years + m // 12
-      m = m % 12 + 1
-      d = adjust_day(y, m, self._days)
-      return from_year_month_day(y, m, d, validate=False)
+      _, _, _, o = _add_months(*self._year_month_day(),
+                               period_tensor.quantity())
+      return o
 
     if period_type == constants.PeriodType.YEAR:
-      y = self._years + period_tensor.quantity()
-      m = tf.broadcast_to(self._months, y.shape)
-      d = adjust_day(y, m, self._days)
-      return from_year_month_day(y, m, d, validate=False)
+      _, _, o = _add_years(*self._year_month_day(), period_tensor.quantity())
+      return o
 
     raise ValueError("Unrecognized period type: {}".format(period_type))
 
@@ -347,21 +439,27 @@ class DateTensor(tensor_wrapper.TensorWrapper):
   def __repr__(self):
     output = "DateTensor: shape={}".format(self.shape)
     if tf.executing_eagerly():
-      contents_np = np.stack(
-          (self._years.numpy(), self._months.numpy(), self._days.numpy()),
-          axis=-1)
+      # Stack on the device, so that the contents are copied to host at once.
+      contents_np = tf.stack(self._year_month_day(), axis=-1).numpy()
       return output + ", contents={}".format(repr(contents_np))
     return output
 
   @classmethod
   def _apply_sequence_to_tensor_op(cls, op_fn, tensor_wrappers):
     o = op_fn([t.ordinal() for t in tensor_wrappers])
+    if any(t._years is None for t in tensor_wrappers):
+      # At least one of the inputs would need to compute years, months and days
+      # for this op. Instead, apply the op once and keep the result lazy.
+      return DateTensor(o)
     y = op_fn([t.year() for t in tensor_wrappers])
     m = op_fn([t.month() for t in tensor_wrappers])
     d = op_fn([t.day() for t in tensor_wrappers])
     return DateTensor(o, y, m, d)
 
   def _apply_op(self, op_fn):
+    if self._years is None:
+      # Keep the result lazy as well.
+      return DateTensor(op_fn(self._ordinals))
     o, y, m, d = (
         op_fn(t)
         for t in (self._ordinals, self._years, self._months, self._days))
@@ -392,32 +490,56 @@ def convert_to_date_tensor(date_inputs):
   if isinstance(date_inputs, DateTensor):
     return date_inputs
 
-  if isinstance(date_inputs, np.ndarray):  # Case 2.
-    date_inputs = date_inputs.astype("datetime64[D]")
-    return from_np_datetimes(date_inputs)
+  # The choice of converter depends only on the type of inputs, so it is cached
+  # to skip the chain of type checks below on repeated calls. The elements of
+  # sequences are still inspected by `_convert_sequence` on every call.
+  input_type = type(date_inputs)
+  converter = _CONVERTERS_BY_TYPE.get(input_type)
+  if converter is None:
+    converter = _resolve_converter(date_inputs)
+    _CONVERTERS_BY_TYPE[input_type] = converter
+  return converter(date_inputs)
+
 
+def _resolve_converter(date_inputs):
+  """Returns the function converting `date_inputs` to a DateTensor."""
+  if isinstance(date_inputs, np.ndarray):  # Case 2.
+    return _convert_np_array
   if tf.is_tensor(date_inputs):  # Case 5
-    return from_ordinals(date_inputs)
-
-  if isinstance(date_inputs, collections.Sequence):
-    if not date_inputs:
-      return from_ordinals([])
-    test_element = date_inputs[0]
-    if hasattr(test_element, "year"):  # Case 1.
-      return from_datetimes(date_inputs)
-    # Case 3
-    if isinstance(test_element, collections.Sequence):
-      return from_tuples(date_inputs)
-    if len(date_inputs) == 3:  # Case 4.
-      return from_year_month_day(date_inputs[0], date_inputs[1], date_inputs[2])
-  # As a last ditch effort, try to convert the sequence to a Tensor to see if
+    return from_ordinals
+  if isinstance(date_inputs, collections.abc.Sequence):
+    return _convert_sequence
+  return _convert_ordinals
+
+
+def _convert_np_array(date_inputs):
+  return from_np_datetimes(date_inputs.astype("datetime64[D]"))
+
+
+def _convert_sequence(date_inputs):
+  """Converts a sequence of supported inputs to a DateTensor."""
+  if not date_inputs:
+    return from_ordinals([])
+  test_element = date_inputs[0]
+  if hasattr(test_element, "year"):  # Case 1.
+    return from_datetimes(date_inputs)
+  # Case 3
+  if isinstance(test_element, collections.abc.Sequence):
+    return from_tuples(date_inputs)
+  if len(date_inputs) == 3:  # Case 4.
+    return from_year_month_day(date_inputs[0], date_inputs[1], date_inputs[2])
+  return _convert_ordinals(date_inputs)
+
+
+def _convert_ordinals(date_inputs):
+  # As a last ditch effort, try to convert the inputs to a Tensor to see if
   # that can work
   try:
     as_ordinals = tf.convert_to_tensor(date_inputs, dtype=tf.int32)
     return from_ordinals(as_ordinals)
   except ValueError as e:
     raise ValueError("Failed to convert inputs to DateTensor. "
-                     "Unrecognized format. Error: " + e)
+                     "Unrecognized format. Error: " + str(e))
 
 
 def from_datetimes(datetimes):
@@ -438,6 +560,19 @@ def from_datetimes(datetimes):
   '''
 
   """
+  # Reading the ordinals takes a single pass over the Python objects, and the
+  # rest is computed in numpy. toordinal() uses the date in the object's own
+  # timezone. (Converting to datetime64 directly would be much slower, and
+  # would convert timezone-aware datetimes to UTC first.)
+  try:
+    ordinals = np.fromiter((dt.toordinal() for dt in datetimes), np.int32,
+                           count=len(datetimes))
+  except AttributeError:
+    pass  # Other structures with 'year', 'month' and 'day' attributes.
+  else:
+    return from_np_datetimes(
+        (ordinals - _ORDINAL_OF_1_1_1970).astype("datetime64[D]"))
+
   years = tf.constant([dt.year for dt in datetimes], dtype=tf.int32)
   months = tf.constant([dt.month for dt in datetimes], dtype=tf.int32)
   days = tf.constant([dt.day for dt in datetimes], dtype=tf.int32)
@@ -471,10 +606,15 @@ def from_np_datetimes(np_datetimes):
   '''
   """
 
-  # There's no easy way to extract year, month, day from numpy datetime, so
-  # we start with ordinals.
-  ordinals = tf.constant(np_datetimes, dtype=tf.int32) + _ORDINAL_OF_1_1_1970
-  return from_ordinals(ordinals, validate=False)
+  # The inputs are on the host already, so all the components are computed in
+  # numpy, without the overhead of executing TF ops.
+  np_datetimes = np_datetimes.astype("datetime64[D]")
+  first_days_of_months = np_datetimes.astype("datetime64[M]")
+  ordinals = np_datetimes.astype(np.int32) + _ORDINAL_OF_1_1_1970
+  years = np_datetimes.astype("datetime64[Y]").astype(np.int32) + 1970
+  months = first_days_of_months.astype(np.int32) % 12 + 1
+  days = (np_datetimes - first_days_of_months).astype(np.int32) + 1
+  return DateTensor(ordinals, years, months, days)
 
 
 def from_tuples(year_month_day_tuples, validate=True):
@@ -489,6 +629,9 @@ def from_tuples(year_month_day_tuples, validate=True):
   Returns:
     DateTensor object.
 
+  Raises:
+    ValueError: If `year_month_day_tuples` is not a sequence of triples.
+
   ## Example
   '''python
   date_tensor = from_tuples([(2015, 4, 15), (2017, 12, 30)])
@@ -496,10 +639,13 @@ def from_tuples(year_month_day_tuples, validate=True):
 
   """
   years, months, days = [], [], []
-  for t in year_month_day_tuples:
-    years.append(t[0])
-    months.append(t[1])
-    days.append(t[2])
+  try:
+    for year, month, day in year_month_day_tuples:
+      years.append(year)
+      months.append(month)
+      days.append(day)
+  except (TypeError, ValueError):  # An element is not a triple.
+    raise ValueError("Expected a sequence of (year, month, day) tuples.")
   years = tf.constant(years, dtype=tf.int32)
   months = tf.constant(months, dtype=tf.int32)
   days = tf.constant(days, dtype=tf.int32)
@@ -541,19 +687,18 @@ def from_year_month_day(year, month, day, validate=True):
     control_deps.append(
         tf.debugging.assert_less_equal(month, constants.Month.DECEMBER.value))
     control_deps.append(tf.debugging.assert_positive(day))
-    is_leap = date_utils.is_leap_year(year)
-    days_in_months = tf.constant(_DAYS_IN_MONTHS_COMBINED, tf.int32)
-    max_days = tf.gather(days_in_months,
-                         month + 12 * tf.dtypes.cast(is_leap, np.int32))
-    control_deps.append(tf.debugging.assert_less_equal(day, max_days))
-    with tf.compat.v1.control_dependencies(control_deps):
-      # Ensure years, months, days themselves are under control_deps.
-      year = tf.identity(year)
-      month = tf.identity(month)
-      day = tf.identity(day)
+    control_deps.append(
+        tf.debugging.assert_less_equal(day, _days_in_month(year, month)))
+    # In eager mode the assertions have already been executed at this point.
+    if not tf.executing_eagerly():
+      with tf.compat.v1.control_dependencies(control_deps):
+        # Ensure years, months, days themselves are under control_deps.
+        year = tf.identity(year)
+        month = tf.identity(month)
+        day = tf.identity(day)
 
   with tf.compat.v1.control_dependencies(control_deps):
-    ordinal = date_utils.year_month_day_to_ordinal(year, month, day)
+    ordinal = _year_month_day_to_ordinal(year, month, day)
     return DateTensor(ordinal, year, month, day)
 
 
@@ -584,12 +729,14 @@ def from_ordinals(ordinals, validate=True):
   control_deps = []
   if validate:
     control_deps.append(tf.debugging.assert_positive(ordinals))
-    with tf.compat.v1.control_dependencies(control_deps):
-      ordinals = tf.identity(ordinals)
+    # In eager mode the assertion has already been executed at this point.
+    if not tf.executing_eagerly():
+      with tf.compat.v1.control_dependencies(control_deps):
+        ordinals = tf.identity(ordinals)
 
-  with tf.compat.v1.control_dependencies(control_deps):
-    years, months, days = date_utils.ordinal_to_year_month_day(ordinals)
-    return DateTensor(ordinals, years, months, days)
+  # Years, months and days are computed lazily from `ordinals`, which are
+  # already under control_deps.
+  return DateTensor(ordinals)
 
 
 # TODO(b/149829315): Move this to a better location once dates module has
@@ -663,3 +810,109 @@ def random_dates(*, start_date, end_date, size=1, seed=None, name=None):
             dtype=tf.float64),
         dtype=tf.int32)
     return from_ordinals(start_date.ordinal() + ordinal_sample, validate=False)
+
+
+def _in_current_context(tensor):
+  """Checks whether `tensor` belongs to the current graph or eager context."""
+  try:
+    graph = tensor.graph
+  except AttributeError:  # Eager tensors have no graph.
+    return tf.executing_eagerly()
+  return graph is tf.compat.v1.get_default_graph()
+
+
+def _to_int32_tensor(value, name):
+  """Converts `value` to an int32 Tensor, unless it already is one."""
+  # DateTensors are mostly created from tensors produced by the functions of
+  # this module, in which case conversion would be a no-op.
+  if isinstance(value, tf.Tensor) and value.dtype == tf.int32:
+    return value
+  return tf.convert_to_tensor(value, dtype=tf.int32, name=name)
+
+
+def _days_in_month(year, month):
+  """Returns the number of days in the given months."""
+  return tf.where(date_utils.is_leap_year(year),
+                  tf.gather(_DAYS_IN_MONTHS_LEAP_TABLE, month),
+                  tf.gather(_DAYS_IN_MONTHS_NON_LEAP_TABLE, month))
+
+
+def _adjust_day(year, month, day):
+  """Decreases days to the largest valid day of the month if necessary."""
+  return tf.math.minimum(day, _days_in_month(year, month))
+
+
+# XLA fuses chains of pointwise ops into a single kernel, instead of executing
+# them op by op, each launching a kernel and materializing an intermediate
+# tensor. However, XLA compiles anew for every input shape, which takes about
+# 50ms on CPU. In eager mode a single call only recovers that cost for about a
+# million elements, so smaller inputs (e.g. schedules and holiday calendars,
+# which typically have many different small shapes) use plain TF ops. When
+# building graphs, plain TF ops are used as well: the graph is then optimized as
+# a whole, and users can compile it with XLA themselves.
+_MIN_SIZE_FOR_XLA = 2**20
+
+
+def _xla_compile(fn, num_args):
+  """Compiles `fn` taking `num_args` int32 Tensors of any shape with XLA."""
+  # A shape-agnostic signature makes sure `fn` is traced only once.
+  input_signature = [tf.TensorSpec(shape=None, dtype=tf.int32)] * num_args
+  try:
+    return tf.function(fn, input_signature=input_signature, jit_compile=True)
+  except TypeError:
+    # `jit_compile` is called `experimental_compile` before TF 2.5.
+    return tf.function(
+        fn, input_signature=input_signature, experimental_compile=True)
+
+
+def _maybe_xla_call(fn, xla_fn, *args):
+  """Calls `xla_fn` for large Tensors in eager mode, and `fn` otherwise."""
+  if tf.executing_eagerly():
+    size = max(arg.shape.num_elements() for arg in args)
+    if size >= _MIN_SIZE_FOR_XLA:
+      return xla_fn(*args)
+  return fn(*args)
+
+
+def _add_months(years, months, days, quantity):
+  """Adds months to dates. Returns a tuple (years, months, days, ordinals)."""
+  return _maybe_xla_call(_add_months_impl, _add_months_xla, years, months,
+                         days, quantity)
+
+
+def _add_months_impl(years, months, days, quantity):
+  m = months - 1 + quantity
+  y = years + m // 12
+  m = m % 12 + 1
+  d = _adjust_day(y, m, days)
+  return y, m, d, date_utils.year_month_day_to_ordinal(y, m, d)
+
+
+_add_months_xla = _xla_compile(_add_months_impl, 4)
+
+
+def _add_years(years, months, days, quantity):
+  """Adds years to dates. Returns a tuple (years, days, ordinals)."""
+  return _maybe_xla_call(_add_years_impl, _add_years_xla, years, months, days,
+                         quantity)
+
+
+def _add_years_impl(years, months, days, quantity):
+  # Months don't change, and the ops below broadcast them as needed.
+  y = years + quantity
+  d = _adjust_day(y, months, days)
+  return y, d, date_utils.year_month_day_to_ordinal(y, months, d)
+
+
+_add_years_xla = _xla_compile(_add_years_impl, 4)
+
+
+def _year_month_day_to_ordinal(year, month, day):
+  """Converts years, months and days to ordinals."""
+  # This is a chain of pointwise ops as well.
+  return _maybe_xla_call(date_utils.year_month_day_to_ordinal,
+                         _year_month_day_to_ordinal_xla, year, month, day)
+
+
+_year_month_day_to_ordinal_xla = _xla_compile(
+    date_utils.year_month_day_to_ordinal, 3)
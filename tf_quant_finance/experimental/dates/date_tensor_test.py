@@ -14,11 +14,14 @@
 # limitations under the License.
 """Tests for date_tensor.py."""
 
+import collections
 import datetime
+from unittest import mock  # pylint: disable=g-importing-member
 import numpy as np
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance.experimental import dates as dateslib
+from tf_quant_finance.experimental.dates import date_tensor as date_tensor_lib
 from tf_quant_finance.experimental.dates import test_data
 from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
 
@@ -74,12 +77,40 @@ class DateTensorTest(tf.test.TestCase):
     y, m, d = [2018, 2042, 1947], [5, 11, 8], [4, 22, 15]
     self.assert_date_tensor_components(date_tensor, y, m, d, None)
 
+  def test_convert_to_date_tensor_lists_of_different_elements(self):
+    # All inputs are lists, but need different conversions.
+    inputs = [
+        [(2018, 5, 4), (2042, 11, 22)],
+        [datetime.date(2018, 5, 4), datetime.date(2042, 11, 22)],
+        [datetime.date(2018, 5, 4).toordinal(),
+         datetime.date(2042, 11, 22).toordinal()],
+    ]
+    for date_inputs in inputs:
+      date_tensor = dateslib.convert_to_date_tensor(date_inputs)
+      self.assert_date_tensor_components(date_tensor, [2018, 2042], [5, 11],
+                                         [4, 22], None)
+
   def test_create_from_date_time_list(self):
     dates = test_data.test_dates
     y, m, d, o, datetimes = unpack_test_dates(dates)
     date_tensor = dateslib.from_datetimes(datetimes)
     self.assert_date_tensor_components(date_tensor, y, m, d, o)
 
+  def test_create_from_timezone_aware_datetimes(self):
+    tz = datetime.timezone(datetime.timedelta(hours=-5))
+    datetimes = [datetime.datetime(2020, 1, 1, 23, 0, tzinfo=tz),
+                 datetime.datetime(2020, 3, 5, 1, 0, tzinfo=tz)]
+    date_tensor = dateslib.from_datetimes(datetimes)
+    self.assert_date_tensor_components(date_tensor, [2020, 2020], [1, 3],
+                                       [1, 5], None)
+
+  def test_create_from_structures_with_date_attributes(self):
+    date_tuple = collections.namedtuple('DateTuple', ['year', 'month', 'day'])
+    inputs = [date_tuple(2018, 5, 4), date_tuple(2042, 11, 22)]
+    date_tensor = dateslib.from_datetimes(inputs)
+    self.assert_date_tensor_components(date_tensor, [2018, 2042], [5, 11],
+                                       [4, 22], None)
+
   def test_create_from_np_datetimes(self):
     dates = test_data.test_dates
     y, m, d, o, datetimes = unpack_test_dates(dates)
@@ -87,12 +118,29 @@ class DateTensorTest(tf.test.TestCase):
     date_tensor = dateslib.from_np_datetimes(np_datetimes)
     self.assert_date_tensor_components(date_tensor, y, m, d, o)
 
+  def test_create_from_np_datetimes_with_time_units(self):
+    np_datetimes = np.array(['2018-05-04T13:45', '1947-08-15T00:00'],
+                            dtype='datetime64[m]')
+    date_tensor = dateslib.from_np_datetimes(np_datetimes)
+    self.assert_date_tensor_components(date_tensor, [2018, 1947], [5, 8],
+                                       [4, 15], None)
+
   def test_create_from_tuples(self):
     dates = test_data.test_dates
     y, m, d, o, _ = unpack_test_dates(dates)
     date_tensor = dateslib.from_tuples(dates)
     self.assert_date_tensor_components(date_tensor, y, m, d, o)
 
+  def test_create_from_empty_tuples(self):
+    date_tensor = dateslib.from_tuples([])
+    self.assertEqual((0,), date_tensor.shape)
+
+  def test_create_from_malformed_tuples_raises(self):
+    with self.assertRaises(ValueError):
+      dateslib.from_tuples([(2020, 1), (2020, 2), (2020, 3)], validate=False)
+    with self.assertRaises(ValueError):
+      dateslib.from_tuples([(2020, 1, 1, 1), (2020, 2)], validate=False)
+
   def test_create_from_year_month_day(self):
     dates = test_data.test_dates
     y, m, d, o, _ = unpack_test_dates(dates)
@@ -105,6 +153,34 @@ class DateTensorTest(tf.test.TestCase):
     date_tensor = dateslib.from_ordinals(o)
     self.assert_date_tensor_components(date_tensor, y, m, d, o)
 
+  def test_ops_on_date_tensor_from_ordinals(self):
+    dates = test_data.test_dates
+    y, m, d, o, _ = unpack_test_dates(dates)
+    date_tensor = dateslib.from_ordinals(o)
+    self.assert_date_tensor_components(date_tensor[1:], y[1:], m[1:], d[1:],
+                                       o[1:])
+    self.assert_date_tensor_components(
+        date_tensor.expand_dims(axis=-1), y[:, np.newaxis], m[:, np.newaxis],
+        d[:, np.newaxis], o[:, np.newaxis])
+
+  def test_date_tensor_from_ordinals_used_in_and_out_of_tf_function(self):
+    dates = [datetime.date.fromordinal(o) for o in (737000, 737100)]
+    date_tensor = dateslib.from_ordinals([737000, 737100])
+
+    @tf.function
+    def get_components():
+      return date_tensor.year(), date_tensor.month(), date_tensor.day()
+
+    expected = ([dt.year for dt in dates], [dt.month for dt in dates],
+                [dt.day for dt in dates])
+    self.assertAllEqual(expected, self.evaluate(get_components()))
+    self.assertAllEqual(expected, self.evaluate(
+        (date_tensor.year(), date_tensor.month(), date_tensor.day())))
+
+  def test_partially_supplied_components_raise(self):
+    with self.assertRaises(ValueError):
+      date_tensor_lib.DateTensor([737000], years=[2018])
+
   def test_validation(self):
     not_raised = []
     for y, m, d in test_data.invalid_dates:
@@ -126,6 +202,20 @@ class DateTensorTest(tf.test.TestCase):
     expected_day_of_week = np.array([dt.weekday() for dt in datetimes])
     self.assertAllEqual(expected_day_of_week, date_tensor.day_of_week())
 
+  def test_day_of_week_used_in_and_out_of_tf_function(self):
+    dates = [datetime.date.fromordinal(o) for o in (737000, 737100)]
+    date_tensor = dateslib.from_ordinals([737000, 737100])
+
+    @tf.function
+    def get_days_of_week_and_year():
+      return date_tensor.day_of_week(), date_tensor.day_of_year()
+
+    expected = ([dt.weekday() for dt in dates],
+                [dt.timetuple().tm_yday for dt in dates])
+    self.assertAllEqual(expected, self.evaluate(get_days_of_week_and_year()))
+    self.assertAllEqual(expected, self.evaluate(
+        (date_tensor.day_of_week(), date_tensor.day_of_year())))
+
   def test_days_until(self):
     dates = test_data.test_dates
     diffs = np.arange(0, len(dates))
@@ -137,6 +227,17 @@ class DateTensorTest(tf.test.TestCase):
     target_date_tensor = dateslib.from_datetimes(target_datetimes)
     self.assertAllEqual(diffs, date_tensor.days_until(target_date_tensor))
 
+  def test_period_length_in_days(self):
+    dates = dateslib.from_tuples([(2020, 2, 25), (2020, 3, 2)])
+    periods = dateslib.periods
+    self.assertAllEqual([3, 3], dates.period_length_in_days(periods.days(3)))
+    self.assertAllEqual([7, 14],
+                        dates.period_length_in_days(periods.weeks([1, 2])))
+    self.assertAllEqual([29, 31], dates.period_length_in_days(periods.month()))
+    self.assertAllEqual([29, 61],
+                        dates.period_length_in_days(periods.months([1, 2])))
+    self.assertAllEqual([366, 365], dates.period_length_in_days(periods.year()))
+
   def test_days_addition(self):
     self.perform_addition_test(test_data.day_addition_data,
                                dateslib.PeriodType.DAY)
@@ -153,6 +254,24 @@ class DateTensorTest(tf.test.TestCase):
     self.perform_addition_test(test_data.year_addition_data,
                                dateslib.PeriodType.YEAR)
 
+  def test_xla_compiled_code_paths(self):
+    # Force the XLA-compiled code paths, which are otherwise only used in eager
+    # mode for large tensors.
+    with mock.patch.object(date_tensor_lib, '_MIN_SIZE_FOR_XLA', 0):
+      y, m, d, o, _ = unpack_test_dates(test_data.test_dates)
+      self.assert_date_tensor_components(
+          dateslib.from_year_month_day(y, m, d), y, m, d, o)
+      self.perform_addition_test(test_data.month_addition_data,
+                                 dateslib.PeriodType.MONTH)
+      self.perform_addition_test(test_data.year_addition_data,
+                                 dateslib.PeriodType.YEAR)
+
+  def test_year_addition_broadcasts_months(self):
+    date_tensor = dateslib.from_tuples([(2020, 2, 29)])
+    result = date_tensor + dateslib.periods.years([[1], [4]])
+    self.assert_date_tensor_components(result, [[2021], [2024]], [[2], [2]],
+                                       [[28], [29]], None)
+
   def perform_addition_test(self, data, period_type):
     dates_from, quantities, expected_dates = [], [], []
     for date_from, quantity, expected_date in data:
@@ -198,6 +317,15 @@ class DateTensorTest(tf.test.TestCase):
     self.assertEqual((3, 1, 2), dates.expand_dims(axis=1).shape)
     self.assertEqual((3, 3, 2), dates.broadcast_to((3, 3, 2)).shape)
 
+  def test_concat_dates_from_ordinals_and_tuples(self):
+    tuples = [(2019, 3, 25), (2020, 1, 2), (2019, 1, 2)]
+    ordinals = [datetime.date(*t).toordinal() for t in tuples]
+    dates1 = dateslib.from_tuples(tuples[:2])
+    dates2 = dateslib.from_ordinals(ordinals[2:])
+    dates = dateslib.DateTensor.concat((dates1, dates2), axis=0)
+    y, m, d = zip(*tuples)
+    self.assert_date_tensor_components(dates, y, m, d, ordinals)
+
   def test_boolean_mask(self):
     dates = dateslib.from_tuples([(2019, 3, 25), (2020, 1, 2), (2019, 1, 2)])
     mask = [True, False, True]